@@ -1,21 +1,31 @@
 import sys
-import time
+import asyncio
 import pandas as pd
 import traceback
 import json
 import os
+import hashlib
+import pickle
+from collections import namedtuple
+import subprocess
+import urllib.request
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QComboBox, QLabel, QLineEdit, QPushButton, QTextEdit, QFileDialog,
-    QMessageBox, QCheckBox, QRadioButton, QGroupBox
+    QMessageBox, QCheckBox, QRadioButton, QGroupBox, QSpinBox
 )
 from PyQt6.QtGui import QFont, QIntValidator
-from PyQt6.QtCore import Qt, QThread, QObject, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 
-from playwright.sync_api import sync_playwright, Page, expect
+from playwright.async_api import async_playwright, Page, expect, Error as PlaywrightError
 from openpyxl import load_workbook
 
 CONFIG_FILE = "config.json"
+STATE_FILE = "gtp_state.json" # Saved Playwright session (cookies/local storage)
+MAX_PARALLEL = 4 # Maximum number of user accounts created concurrently
+CDP_PORT = 9222 # Remote debugging port of the shared browser
+BROWSER_PROFILE_DIR = "./gtp_profile"
+USER_DATA_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "gtp_tool")
 
 # =============================================================================
 # Browser Driver Class
@@ -24,294 +34,567 @@ class BrowserDriver:
     """
     Manages all browser interactions using Playwright.
     """
-    def __init__(self, progress_callback):
+    FAST_TIMEOUT_MS = 5000 # Default wait for an element to become visible
+    NAV_TIMEOUT_MS = 20000 # Wait for a page navigation/load
+    MFA_TIMEOUT_MS = 120000 # Wait for the user to approve the MFA push
+    RESULT_TIMEOUT_MS = 30000 # Wait for the success/error panel after submitting a form
+
+    # The shared Chromium process, kept alive across automation runs.
+    browser_process = None
+
+    def __init__(self, progress_callback, reuse_session=False, element_timeout_ms=None, verbose=False):
         self.playwright = None
         self.browser = None
+        self.context = None
         self.page = None
+        self.storage_state = None
         self.progress_callback = progress_callback
-
-    def launch(self):
+        self.reuse_session = reuse_session
+        self.verbose = verbose
+        self.element_timeout_ms = element_timeout_ms or self.FAST_TIMEOUT_MS
+        self.session_restored = False
+        self.browser_is_shared = False
+        self._pages_on_create_form = set() # Pages already showing a fresh Create User form
+        self._locators = {} # (page, key) -> Locator, reused across users
+
+    def log_debug(self, message):
+        """Reports a granular step; only shown when Debug Mode is enabled."""
+        if self.verbose:
+            self.progress_callback(message)
+
+    @staticmethod
+    def get_shared_browser_endpoint():
+        """Returns the WebSocket endpoint of the shared browser, or None if it is not running."""
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{CDP_PORT}/json/version", timeout=1) as response:
+                return json.load(response)["webSocketDebuggerUrl"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @classmethod
+    def shutdown_shared_browser(cls):
+        """Terminates the shared browser process. Returns True if one was running."""
+        process = cls.browser_process
+        cls.browser_process = None
+        if process is None or process.poll() is not None:
+            return False
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        return True
+
+    async def start_shared_browser(self):
+        """
+        Spawns Chromium with remote debugging enabled so later runs can connect to it.
+        Returns the WebSocket endpoint, or None if the browser could not be started.
+        """
+        # A process we started earlier that no longer answers would hold the profile; stop it first.
+        if await asyncio.to_thread(BrowserDriver.shutdown_shared_browser):
+            self.progress_callback("[INFO] Stopped an unresponsive shared browser.")
+
+        self.progress_callback(f"Starting shared browser on port {CDP_PORT}...")
+        try:
+            BrowserDriver.browser_process = subprocess.Popen([
+                self.playwright.chromium.executable_path,
+                f"--remote-debugging-port={CDP_PORT}",
+                f"--user-data-dir={BROWSER_PROFILE_DIR}",
+                "--no-first-run",
+                "--no-default-browser-check",
+            ])
+        except OSError as e:
+            self.progress_callback(f"[INFO] Could not start shared browser. Details: {e}")
+            return None
+
+        for _ in range(20):
+            ws_endpoint = await asyncio.to_thread(self.get_shared_browser_endpoint)
+            if ws_endpoint:
+                return ws_endpoint
+            await asyncio.sleep(0.5)
+
+        self.progress_callback("[INFO] Shared browser did not expose its debugging endpoint. Shutting it down.")
+        await asyncio.to_thread(BrowserDriver.shutdown_shared_browser)
+        return None
+
+    async def launch(self):
         self.progress_callback("Launching browser...")
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless=False, slow_mo=50)
-        self.page = self.browser.new_page()
+        self.playwright = await async_playwright().start()
+
+        ws_endpoint = await asyncio.to_thread(self.get_shared_browser_endpoint)
+        if not ws_endpoint:
+            ws_endpoint = await self.start_shared_browser()
+        try:
+            if not ws_endpoint:
+                raise ConnectionError("Shared browser is not reachable.")
+            self.browser = await self.playwright.chromium.connect_over_cdp(ws_endpoint)
+            self.browser_is_shared = True
+            self.progress_callback("Connected to shared browser.")
+        except Exception as e:
+            self.progress_callback(f"[INFO] Could not connect to shared browser, launching a private one. Details: {e}")
+            self.browser = await self.playwright.chromium.launch(headless=False)
+
+        if self.reuse_session and os.path.exists(STATE_FILE):
+            self.progress_callback(f"Loading saved session from {STATE_FILE}...")
+            self.context = await self.browser.new_context(storage_state=STATE_FILE)
+            self.session_restored = True
+        else:
+            self.context = await self.browser.new_context()
+        self.page = await self.context.new_page()
         self.progress_callback("Browser launched successfully.")
 
-    def login(self, url, email, password):
+    async def login(self, url, email, password):
         if not self.page:
             raise Exception("Browser is not launched. Call launch() first.")
 
-        self.progress_callback(f"Navigating to login page: {url}")
-        self.page.goto(url, timeout=60000)
+        if self.session_restored and await self.resume_saved_session(url):
+            return
+
+        self.log_debug(f"Navigating to login page: {url}")
+        await self.page.goto(url, timeout=self.NAV_TIMEOUT_MS)
 
-        self.progress_callback("Entering email...")
-        email_locator = self.page.locator('#input28')
-        expect(email_locator).to_be_visible(timeout=30000)
-        email_locator.fill(email)
+        self.log_debug("Entering email...")
+        email_locator = self.page.get_by_label("Username", exact=True)
+        await expect(email_locator).to_be_visible(timeout=self.element_timeout_ms)
+        await email_locator.fill(email)
         
-        self.progress_callback("Clicking 'Next' button...")
+        self.log_debug("Clicking 'Next' button...")
         next_button_locator = self.page.locator('input[value="Next"]')
-        expect(next_button_locator).to_be_visible(timeout=30000)
-        next_button_locator.click()
-        self.progress_callback("Email submitted.")
-
-        self.progress_callback("Entering password...")
-        password_locator = self.page.locator('#input29')
-        expect(password_locator).to_be_visible(timeout=30000)
-        password_locator.fill(password)
+        await expect(next_button_locator).to_be_visible(timeout=self.element_timeout_ms)
+        await next_button_locator.click()
+        self.log_debug("Email submitted.")
+
+        self.log_debug("Entering password...")
+        password_locator = self.page.get_by_label("Password", exact=True)
+        await expect(password_locator).to_be_visible(timeout=self.element_timeout_ms)
+        await password_locator.fill(password)
         
-        self.progress_callback("Clicking 'Verify' button...")
+        self.log_debug("Clicking 'Verify' button...")
         verify_button_locator = self.page.locator('input[value="Verify"]')
-        expect(verify_button_locator).to_be_visible(timeout=30000)
-        verify_button_locator.click()
-        self.progress_callback("Password submitted.")
+        await expect(verify_button_locator).to_be_visible(timeout=self.element_timeout_ms)
+        await verify_button_locator.click()
+        self.log_debug("Password submitted.")
 
-        self.progress_callback("Looking for MFA options...")
+        push_option_locator = self.page.locator('[aria-label="Select to get a push notification to the Okta Verify app."]')
+        push_sent_locator = self.page.get_by_text("We've sent a push notification", exact=False)
+        create_user_link = self.page.get_by_role("link", name="Create User", exact=True)
+
+        # Wait for whichever screen Okta shows next instead of probing for the push option
+        # with a short fixed timeout, which could miss a slow authenticator list.
+        self.log_debug("Looking for MFA options...")
         try:
-            push_option_locator = self.page.locator('[aria-label="Select to get a push notification to the Okta Verify app."]')
-            expect(push_option_locator).to_be_visible(timeout=30000)
-            self.progress_callback("Push notification option found. Clicking it.")
-            push_option_locator.click()
-
-            self.progress_callback("Waiting for push sent confirmation...")
-            push_sent_locator = self.page.get_by_text("We've sent a push notification", exact=False)
-            expect(push_sent_locator).to_be_visible(timeout=15000)
+            await expect(push_option_locator.or_(push_sent_locator).or_(create_user_link).first).to_be_visible(timeout=self.element_timeout_ms)
+        except AssertionError:
+            pass
+        if await push_option_locator.is_visible():
+            self.log_debug("Push notification option found. Clicking it.")
+            await push_option_locator.click()
+        else:
+            self.progress_callback("[INFO] Did not find MFA selection screen. Assuming push was sent by default.")
+
+        # Race the push confirmation against the dashboard appearing, so a device that
+        # skips the push screen entirely proceeds as soon as it is logged in.
+        self.log_debug("Waiting for push sent confirmation...")
+        push_sent_task = asyncio.create_task(expect(push_sent_locator).to_be_visible(timeout=self.element_timeout_ms))
+        logged_in_task = asyncio.create_task(expect(create_user_link).to_be_visible(timeout=self.MFA_TIMEOUT_MS))
+        done, _ = await asyncio.wait([push_sent_task, logged_in_task], return_when=asyncio.FIRST_COMPLETED)
+        if push_sent_task not in done:
+            push_sent_task.cancel()
+        elif push_sent_task.exception() is None:
             self.progress_callback("Confirmation received: Push notification sent.")
-        except Exception as e:
-            self.progress_callback(f"[INFO] Did not find MFA selection screen, or an error occurred. Assuming push was sent by default. Details: {e}")
-
-        self.progress_callback("Waiting for Multi-Factor Authentication (MFA)...")
-        self.progress_callback(">>> Please approve the notification on your phone. <<<")
-        
-        self.page.wait_for_url(lambda url: "okta.com" not in url, timeout=120000)
+        else:
+            self.progress_callback("[INFO] No push confirmation shown. Assuming push was sent by default.")
+
+        if not logged_in_task.done():
+            self.progress_callback("Waiting for Multi-Factor Authentication (MFA)...")
+            self.progress_callback(">>> Please approve the notification on your phone. <<<")
+        # Gate on the dashboard's Create User link rather than on leaving okta.com and then
+        # pausing; it only appears once MFA is approved and the dashboard can be used.
+        await logged_in_task
         self.progress_callback("MFA approved. Login successful!")
-        
-        self.progress_callback("Pausing briefly for dashboard to initialize...")
-        self.page.wait_for_timeout(3000)
 
-    def wait_for_page_to_settle(self):
-        self.progress_callback("Waiting for page to fully load...")
-        self.page.wait_for_load_state("networkidle", timeout=30000)
-        self.progress_callback("Page has settled.")
+        # Export the session cookies so parallel worker contexts skip the MFA flow.
+        if self.reuse_session:
+            self.storage_state = await self.context.storage_state(path=STATE_FILE)
+            self.progress_callback(f"Session saved to {STATE_FILE}.")
+        else:
+            self.storage_state = await self.context.storage_state()
 
-    def navigate_to_create_user_page(self, base_url):
-        if not self.page:
+    async def resume_saved_session(self, base_url):
+        """
+        Checks whether the session loaded from STATE_FILE is still valid.
+        Returns True if it is; otherwise deletes the file and returns False.
+        """
+        create_url = f"{base_url}/CreateUserAccount"
+        self.log_debug(f"Checking saved session against: {create_url}")
+        response = await self.page.goto(create_url, timeout=self.NAV_TIMEOUT_MS)
+
+        if "okta.com" in self.page.url or (response and response.status == 401):
+            self.progress_callback("[INFO] Saved session has expired. Logging in again.")
+            if os.path.exists(STATE_FILE):
+                os.remove(STATE_FILE)
+            return False
+
+        self.progress_callback("Saved session is still valid. Skipping login.")
+        self.storage_state = await self.context.storage_state()
+        return True
+
+    async def wait_for_page_to_settle(self):
+        self.log_debug("Waiting for page to load...")
+        await self.page.wait_for_load_state("domcontentloaded", timeout=self.NAV_TIMEOUT_MS)
+        self.log_debug("Page has settled.")
+
+    async def navigate_to_create_user_page(self, base_url, page=None):
+        page = page or self.page
+        if not page:
             raise Exception("Browser is not launched.")
         create_url = f"{base_url}/CreateUserAccount"
-        self.progress_callback(f"Navigating to Create User page: {create_url}")
-        self.page.goto(create_url, timeout=60000)
-        self.wait_for_page_to_settle()
+        self.log_debug(f"Navigating to Create User page: {create_url}")
+        # No settle wait here: the form's first visibility check gates on readiness.
+        await page.goto(create_url, timeout=self.NAV_TIMEOUT_MS)
+
+    def _L(self, page, key, selector):
+        """
+        Returns the cached Locator for key on page, creating it on first use.
+        selector is a CSS/XPath string or a callable that builds the Locator from the page.
+        """
+        locator = self._locators.get((page, key))
+        if locator is None:
+            locator = page.locator(selector) if isinstance(selector, str) else selector(page)
+            self._locators[(page, key)] = locator
+        return locator
+
+    async def open_create_user_page(self):
+        """
+        Opens a page in a new browser context that shares the logged-in session,
+        so several users can be created concurrently.
+        """
+        if not self.browser:
+            raise Exception("Browser is not launched.")
+        context = await self.browser.new_context(storage_state=self.storage_state)
+        return await context.new_page()
+
+    async def close_create_user_page(self, page):
+        self._pages_on_create_form.discard(page)
+        self._locators = {entry: locator for entry, locator in self._locators.items() if entry[0] is not page}
+        await page.context.close()
+
+    async def create_user(self, base_url, page, user_details, user_password):
+        """
+        Creates a single user account on the given page. The page is only navigated
+        when it is not already showing a fresh Create User form.
+        """
+        if page in self._pages_on_create_form:
+            self._pages_on_create_form.discard(page)
+        else:
+            await self.navigate_to_create_user_page(base_url, page)
+
+        success = await self.fill_user_creation_form(page, user_details, user_password)
+        if success and await self.reset_create_user_form(page):
+            self._pages_on_create_form.add(page)
+        return success
+
+    async def reset_create_user_form(self, page):
+        """
+        Clicks 'Create another' after a success, if offered. Returns True only if the form
+        was reset and the previous success panel is hidden.
+        """
+        create_another = self._L(page, "create_another", lambda p: p.get_by_role("link", name="Create another").or_(p.get_by_role("button", name="Create another")).first)
+        if not await create_another.is_visible():
+            return False
+        try:
+            await create_another.click()
+            # The previous user's success panel must be gone, or the next user's result check passes at once.
+            await expect(self._L(page, "success", ".card-panel.green")).to_be_hidden(timeout=self.element_timeout_ms)
+        except Exception as e:
+            self.log_debug(f"  - [INFO] Could not reset the Create User form, the next user will reload it. Details: {e}")
+            return False
+        return True
 
-    def fill_user_creation_form(self, user_details, user_password):
-        username = f"{user_details['Username']}{user_details['Postfix']}"
-        currency_code = str(user_details['Currency']).split(' ')[0]
+    async def fill_user_creation_form(self, page, user_details, user_password):
+        username = user_details.FullUsername
+        currency_code = user_details.CurrencyCode
 
-        self.progress_callback(f"--- Creating user account: {username} ---")
+        # Collect this user's lines and report them as one block once the outcome is known.
+        steps = [f"--- Creating user account: {username} ---"]
+        try:
+            return await self._submit_user_creation_form(page, username, currency_code, user_password, steps)
+        finally:
+            self.progress_callback("\n".join(steps))
 
-        self.progress_callback("  - Setting Market...")
-        market_dropdown_button = self.page.locator('//*[@id="accountForm"]/div/div[2]/div/div/input')
-        expect(market_dropdown_button).to_be_visible(timeout=15000)
-        market_dropdown_button.click()
-        self.page.locator("span", has_text="DEF (No Regulated Market)").click()
-        
-        self.progress_callback("  - Setting Product...")
-        product_dropdown_button = self.page.locator('//*[@id="accountForm"]/div/div[3]/div/div/input')
-        expect(product_dropdown_button).to_be_visible(timeout=15000)
-        product_dropdown_button.click()
-        self.page.locator("span", has_text="Island Paradise Mobile (5007)").click()
-        
-        self.progress_callback("  - Filling Username...")
-        username_locator = self.page.locator("#username")
-        expect(username_locator).to_be_visible(timeout=15000)
-        username_locator.fill(username)
-        
-        self.progress_callback("  - Filling Password...")
-        password_locator = self.page.locator("#password")
-        expect(password_locator).to_be_visible(timeout=15000)
-        password_locator.fill(user_password)
-        
-        self.progress_callback("  - Setting Currency...")
-        currency_dropdown_button = self.page.locator('//div[9]//div[1]//div[1]//input[1]')
-        expect(currency_dropdown_button).to_be_visible(timeout=15000)
-        currency_dropdown_button.click()
-        self.page.locator(f"span:has-text('({currency_code})')").click()
-        
-        self.progress_callback("  - Clicking 'Create Account'...")
-        create_button_locator = self.page.locator("#submit")
-        expect(create_button_locator).to_be_visible(timeout=30000)
-        create_button_locator.click()
+    async def _submit_user_creation_form(self, page, username, currency_code, user_password, steps):
+        # Wait for the form to render, gating on a field the bulk fill actually writes.
+        username_input = self._L(page, "username", "#username")
+        await expect(username_input).to_be_visible(timeout=self.element_timeout_ms)
+
+        if self.verbose:
+            steps.append("  - Filling Market, Product, Username, Password and Currency, then clicking 'Create Account'...")
+        try:
+            await fill_form_bulk(page, [
+                {"selector": "#accountForm > div > div:nth-of-type(2) select", "action": "select", "value": "DEF (No Regulated Market)"},
+                {"selector": "#accountForm > div > div:nth-of-type(3) select", "action": "select", "value": "Island Paradise Mobile (5007)"},
+                {"selector": "#username", "action": "fill", "value": username},
+                {"selector": "#password", "action": "fill", "value": user_password},
+                {"selector": "#accountForm > div > div:nth-of-type(9) select", "action": "select", "value": f"({currency_code})"},
+                {"selector": "#submit", "action": "click"},
+            ], self.element_timeout_ms)
+        except PlaywrightError as e:
+            # A missing field or option fails only this user, not the whole run.
+            steps.append(f"  - [CRITICAL] Could not fill the Create User form. Error: {e}")
+            return False
 
         try:
-            start_time = time.time()
-            while time.time() - start_time < 30:
-                success_locator = self.page.locator(".card-panel.green")
-                error_locator = self.page.locator(".card-panel.red")
-
-                if success_locator.is_visible():
-                    self.progress_callback(f"  - Successfully created user: {username}")
-                    return True
-                
-                if error_locator.is_visible():
-                    self.progress_callback("  - [ERROR] Creation failed. Checking logs...")
-                    log_header = self.page.locator("div.collapsible-header:has-text('Log')")
-                    expect(log_header).to_be_visible(timeout=10000)
-                    log_header.click()
-                    
-                    log_message_locator = self.page.locator("#resultContainerMessage")
-                    expect(log_message_locator).to_be_visible(timeout=10000)
-                    error_details = log_message_locator.inner_text()
-                    
-                    self.progress_callback(f"  - Detailed Error: {error_details.strip()}")
-                    return False
-                
-                self.page.wait_for_timeout(500)
+            success_locator = self._L(page, "success", ".card-panel.green")
+            error_locator = self._L(page, "error", ".card-panel.red")
+            try:
+                await expect(success_locator.or_(error_locator).first).to_be_visible(timeout=self.RESULT_TIMEOUT_MS)
+            except AssertionError:
+                raise Exception("Timeout: Neither success nor error panel became visible after 30 seconds.")
+
+            if await success_locator.is_visible():
+                steps.append(f"  - Successfully created user: {username}")
+                return True
+
+            steps.append("  - [ERROR] Creation failed. Checking logs...")
+            log_header = self._L(page, "log_header", "div.collapsible-header:has-text('Log')")
+            await expect(log_header).to_be_visible(timeout=self.element_timeout_ms)
+            await log_header.click()
             
-            raise Exception("Timeout: Neither success nor error panel became visible after 30 seconds.")
+            log_message_locator = self._L(page, "log_message", "#resultContainerMessage")
+            await expect(log_message_locator).to_be_visible(timeout=self.element_timeout_ms)
+            error_details = await log_message_locator.inner_text()
+            
+            steps.append(f"  - Detailed Error: {error_details.strip()}")
+            return False
 
         except Exception as e:
-            self.progress_callback(f"  - [CRITICAL] Could not determine creation status. Error: {e}")
+            steps.append(f"  - [CRITICAL] Could not determine creation status. Error: {e}")
             return False
 
-    def migrate_user_to_lvc(self, base_url, username):
+    async def migrate_user_to_lvc(self, base_url, username):
         self.progress_callback(f"--- Starting LVC Migration for user: {username} ---")
         
         user_accounts_url = f"{base_url}/useraccounts"
-        self.progress_callback(f"Navigating to User Accounts page: {user_accounts_url}")
-        self.page.goto(user_accounts_url, timeout=60000)
-        self.wait_for_page_to_settle()
-
-        self.progress_callback("Clicking search icon to reveal search bar...")
-        search_button_locator = self.page.locator("//button[@aria-label='Search']")
-        expect(search_button_locator).to_be_visible(timeout=15000)
-        search_button_locator.click()
-
-        self.progress_callback(f"Searching for user: {username}")
-        search_input_locator = self.page.locator("//input[@type='text']").first
-        expect(search_input_locator).to_be_visible(timeout=15000)
-        search_input_locator.fill(username)
-        self.page.keyboard.press("Enter")
+        self.log_debug(f"Navigating to User Accounts page: {user_accounts_url}")
+        await self.page.goto(user_accounts_url, timeout=self.NAV_TIMEOUT_MS)
+        await self.wait_for_page_to_settle()
+
+        self.log_debug("Clicking search icon to reveal search bar...")
+        search_button_locator = self.page.get_by_role("button", name="Search")
+        await expect(search_button_locator).to_be_visible(timeout=self.element_timeout_ms)
+        await search_button_locator.click()
+
+        self.log_debug(f"Searching for user: {username}")
+        search_input_locator = self.page.get_by_role("textbox").first
+        await expect(search_input_locator).to_be_visible(timeout=self.element_timeout_ms)
+        await search_input_locator.fill(username)
+        await self.page.keyboard.press("Enter")
         
-        self.progress_callback("Waiting for search results...")
-        self.page.wait_for_timeout(1500)
-        self.wait_for_page_to_settle()
-        self.progress_callback("Search complete.")
+        self.log_debug("Waiting for search results...")
+        await self.page.wait_for_timeout(1500)
+        await self.wait_for_page_to_settle()
+        self.log_debug("Search complete.")
 
-        self.progress_callback("Locating user in table...")
+        self.log_debug("Locating user in table...")
         user_row_locator = self.page.locator(f"tr:has-text('{username}')")
-        expect(user_row_locator).to_be_visible(timeout=15000)
-        self.progress_callback("User row found.")
+        await expect(user_row_locator).to_be_visible(timeout=self.element_timeout_ms)
+        self.log_debug("User row found.")
 
-        self.progress_callback("Clicking 'three dots' menu...")
+        self.log_debug("Clicking 'three dots' menu...")
         three_dots_button = user_row_locator.locator("span.MuiIconButton-label")
-        expect(three_dots_button).to_be_visible(timeout=10000)
-        three_dots_button.click()
+        await expect(three_dots_button).to_be_visible(timeout=self.element_timeout_ms)
+        await three_dots_button.click()
         
-        self.progress_callback("Clicking 'Migrate LVCS' option...")
+        self.log_debug("Clicking 'Migrate LVCS' option...")
         migrate_option = self.page.get_by_role("menuitem", name="Migrate LVCS")
-        expect(migrate_option).to_be_visible(timeout=10000)
-        migrate_option.click()
+        await expect(migrate_option).to_be_visible(timeout=self.element_timeout_ms)
+        await migrate_option.click()
 
-        self.progress_callback("Confirming migration...")
+        self.log_debug("Confirming migration...")
         confirmation_button = self.page.get_by_role("button", name="Migrate")
-        expect(confirmation_button).to_be_visible(timeout=10000)
-        confirmation_button.click()
+        await expect(confirmation_button).to_be_visible(timeout=self.element_timeout_ms)
+        await confirmation_button.click()
 
-        self.progress_callback("Pausing for 1 second to allow migration to complete...")
-        self.page.wait_for_timeout(1000)
+        self.log_debug("Pausing for 1 second to allow migration to complete...")
+        await self.page.wait_for_timeout(1000)
         self.progress_callback(f"Successfully migrated {username} to LVC.")
 
-    def add_balance_to_user(self, base_url, username, amount):
+    async def add_balance_to_user(self, base_url, username, amount):
         self.progress_callback(f"--- Adding balance to user: {username} ---")
         
         balance_url = f"{base_url}/BalanceUserAccount"
-        self.progress_callback(f"Navigating to Balance page: {balance_url}")
-        self.page.goto(balance_url, timeout=60000)
-        self.wait_for_page_to_settle()
+        self.log_debug(f"Navigating to Balance page: {balance_url}")
+        await self.page.goto(balance_url, timeout=self.NAV_TIMEOUT_MS)
+        await self.wait_for_page_to_settle()
 
-        self.progress_callback(f"Filling balance form for {username}...")
+        self.log_debug(f"Filling balance form for {username}...")
         
         try:
             error_locator = self.page.locator("#loginName-error")
-            if error_locator.is_visible(timeout=1000):
+            if await error_locator.is_visible(timeout=1000):
                 self.progress_callback(f"  - [ERROR] User '{username}' not found on balance page. Skipping.")
                 return
         except:
             pass
 
         username_locator = self.page.locator("#loginName")
-        expect(username_locator).to_be_visible(timeout=15000)
-        username_locator.fill(username)
+        await expect(username_locator).to_be_visible(timeout=self.element_timeout_ms)
+        await username_locator.fill(username)
 
         amount_locator = self.page.locator("#amount")
-        expect(amount_locator).to_be_visible(timeout=15000)
-        amount_locator.fill(amount)
+        await expect(amount_locator).to_be_visible(timeout=self.element_timeout_ms)
+        await amount_locator.fill(amount)
 
         set_balance_button = self.page.locator("#submit")
-        expect(set_balance_button).to_be_visible(timeout=15000)
-        set_balance_button.click()
+        await expect(set_balance_button).to_be_visible(timeout=self.element_timeout_ms)
+        await set_balance_button.click()
 
         try:
-            start_time = time.time()
-            while time.time() - start_time < 30:
-                success_locator = self.page.locator(".card-panel.green")
-                if success_locator.is_visible():
-                    self.progress_callback(f"  - Successfully added balance to {username}")
-                    return
-                self.page.wait_for_timeout(500)
-            raise Exception("Timeout: Could not find success message after setting balance.")
+            success_locator = self.page.locator(".card-panel.green")
+            try:
+                await expect(success_locator).to_be_visible(timeout=self.RESULT_TIMEOUT_MS)
+            except AssertionError:
+                raise Exception("Timeout: Could not find success message after setting balance.")
+            self.progress_callback(f"  - Successfully added balance to {username}")
         except Exception as e:
             self.progress_callback(f"  - [CRITICAL] Could not determine balance status. Error: {e}")
 
-    def close(self):
-        if self.browser:
-            self.browser.close()
+    async def close(self):
+        # A shared browser is left running for the next run; only our context is closed.
+        if self.context:
+            await self.context.close()
+        if self.browser and not self.browser_is_shared:
+            await self.browser.close()
             self.progress_callback("Browser closed.")
         if self.playwright:
-            self.playwright.stop()
+            await self.playwright.stop()
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
+# One row of user data; picklable, unlike the ad-hoc namedtuples from DataFrame.itertuples().
+# FullUsername (Username + Postfix) and CurrencyCode (e.g. "USD") are precomputed in parse_user_data.
+User = namedtuple('User', ['Currency', 'Username', 'Postfix', 'FullUsername', 'CurrencyCode'])
+
+FILL_FORM_BULK_JS = """
+async ({ ops, timeout }) => {
+    // Polls inside the page, so an element or option that is rendered late (e.g. an option
+    // list filled in after a previous 'change') is waited for without extra CDP round-trips.
+    const waitFor = async (find, message) => {
+        const deadline = Date.now() + timeout;
+        for (;;) {
+            const found = find();
+            if (found) return found;
+            if (Date.now() > deadline) throw new Error(message);
+            await new Promise(resolve => setTimeout(resolve, 50));
+        }
+    };
+    for (const o of ops) {
+        const el = await waitFor(() => document.querySelector(o.selector), `Element not found: ${o.selector}`);
+        if (o.action === 'fill') {
+            el.value = o.value;
+            el.dispatchEvent(new Event('input', { bubbles: true }));
+            // Per-field fill() also produced change/focusout, which the site's validation listens for.
+            el.dispatchEvent(new Event('change', { bubbles: true }));
+            el.dispatchEvent(new FocusEvent('focusout', { bubbles: true }));
+        } else if (o.action === 'select') {
+            const option = await waitFor(
+                () => Array.from(el.options).find(opt => opt.text.includes(o.value)),
+                `Option not found in ${o.selector}: ${o.value}`
+            );
+            if (el.value !== option.value) {
+                el.value = option.value;
+                el.dispatchEvent(new Event('change', { bubbles: true }));
+            }
+        } else if (o.action === 'click') {
+            el.click();
+        }
+    }
+}
+"""
+
+async def fill_form_bulk(page, ops, timeout_ms):
+    """
+    Applies a list of form operations in a single page.evaluate() call.
+    Each op is a dict with 'selector', 'action' ('fill', 'select' or 'click')
+    and, except for 'click', a 'value'. 'select' matches the first option whose
+    label contains the value. Each element and option is waited for up to
+    timeout_ms before an error is raised.
+    """
+    await page.evaluate(FILL_FORM_BULK_JS, {"ops": ops, "timeout": timeout_ms})
+
+def add_derived_user_columns(df):
+    """Adds the FullUsername and CurrencyCode columns using vectorised string operations."""
+    return df.assign(
+        FullUsername=df['Username'].astype(str) + df['Postfix'].astype(str),
+        CurrencyCode=df['Currency'].astype(str).str.split(' ', n=1).str[0],
+    )
+
 def parse_user_data(file_path, mode):
     """
     Parses user data from the Excel file based on the selected mode.
+    Results are cached on disk and reused until the file is modified.
     """
     required_sheet = 'Sheet1'
     lvc_users, standard_users = [], []
 
     try:
-        xls = pd.ExcelFile(file_path)
+        mtime = os.path.getmtime(file_path)
     except FileNotFoundError:
         raise FileNotFoundError(f"The file could not be found at the path: {file_path}")
+
+    # One cache file per workbook and mode, overwritten when the workbook changes; the mtime is
+    # stored inside it. The record fields are part of the key so older layouts are ignored.
+    cache_key = f"{os.path.abspath(file_path)}|{mode}|{','.join(User._fields)}"
+    cache_path = os.path.join(USER_DATA_CACHE_DIR, f"{hashlib.sha1(cache_key.encode()).hexdigest()}.pkl")
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_mtime, cached_lvc_users, cached_standard_users = pickle.load(f)
+        if cached_mtime == mtime:
+            return cached_lvc_users, cached_standard_users
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+
+    # Read every sheet in one pass instead of probing sheet names and re-reading per section.
+    try:
+        # Only the Postfix columns (C and G) are forced to str; Currency and Username keep their
+        # native types so update_excel_with_lvc_names can match them against openpyxl's cell values.
+        sheets = pd.read_excel(file_path, sheet_name=None, header=None, engine="openpyxl", dtype={2: str, 6: str})
     except Exception as e:
         raise IOError(f"The file at {file_path} could not be opened or is corrupted. Details: {e}")
-    if required_sheet not in xls.sheet_names:
+    if required_sheet not in sheets:
         raise ValueError(f"A required sheet named '{required_sheet}' was not found in the Excel file.")
+    sheet = sheets[required_sheet]
     
     # --- MODIFIED: More robust positional reading and case-insensitive header checking ---
     
     lvc_required_columns = ['lvc currency', 'username', 'postfix', 'lvc_username']
     standard_required_columns = ['std_currency', 'std_username', 'std_postfix']
 
+    headers = [str(col).strip().lower() for col in sheet.iloc[0]]
+    rows = sheet.iloc[1:]
+
     if mode in ["all", "lvc_only"]:
-        lvc_df = pd.read_excel(file_path, sheet_name=required_sheet, header=0, usecols="A:D", dtype={'Postfix': str})
-        lvc_df.columns = [str(col).strip().lower() for col in lvc_df.columns]
-        if not all(col in lvc_df.columns for col in lvc_required_columns):
+        lvc_df = rows.iloc[:, 0:4].set_axis(headers[0:4], axis=1)
+        if not set(lvc_required_columns).issubset(lvc_df.columns):
             raise ValueError(f"The LVC section (Columns A-D) is missing required headers: LVC Currency, Username, Postfix, LVC_username.")
-        lvc_df.rename(columns={'lvc currency': 'Currency', 'username': 'Username', 'postfix': 'Postfix', 'lvc_username': 'LVC_username'}, inplace=True)
-        lvc_df['Postfix'] = lvc_df['Postfix'].fillna('')
-        lvc_df.dropna(subset=['Currency'], inplace=True)
-        lvc_users = lvc_df.to_dict('records')
+        lvc_df = lvc_df.rename(columns={'lvc currency': 'Currency', 'username': 'Username', 'postfix': 'Postfix', 'lvc_username': 'LVC_username'}).dropna(subset=['Currency']).fillna({'Postfix': ''}).pipe(add_derived_user_columns)
+        lvc_users = list(map(User._make, lvc_df[list(User._fields)].itertuples(index=False, name=None)))
 
     if mode in ["all", "standard_only"]:
-        standard_df = pd.read_excel(file_path, sheet_name=required_sheet, header=0, usecols="E:G", dtype={'Postfix': str})
-        standard_df.columns = [str(col).strip().lower() for col in standard_df.columns]
-        if not all(col in standard_df.columns for col in standard_required_columns):
+        standard_df = rows.iloc[:, 4:7].set_axis(headers[4:7], axis=1)
+        if not set(standard_required_columns).issubset(standard_df.columns):
             raise ValueError(f"The Standard section (Columns E-G) is missing required headers: std_currency, std_username, std_postfix.")
-        standard_df.rename(columns={'std_currency': 'Currency', 'std_username': 'Username', 'std_postfix': 'Postfix'}, inplace=True)
-        standard_df['Postfix'] = standard_df['Postfix'].fillna('')
-        standard_df.dropna(subset=['Currency'], inplace=True)
-        standard_users = standard_df.to_dict('records')
+        standard_df = standard_df.rename(columns={'std_currency': 'Currency', 'std_username': 'Username', 'std_postfix': 'Postfix'}).dropna(subset=['Currency']).fillna({'Postfix': ''}).pipe(add_derived_user_columns)
+        standard_users = list(map(User._make, standard_df[list(User._fields)].itertuples(index=False, name=None)))
+
+    try:
+        os.makedirs(USER_DATA_CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump((mtime, lvc_users, standard_users), f)
+    except OSError as e:
+        print(f"Could not write user data cache: {e}")
         
     return lvc_users, standard_users
 
@@ -340,9 +623,9 @@ def update_excel_with_lvc_names(file_path, migrated_user):
         workbook = load_workbook(filename=file_path)
         sheet = workbook['Sheet1']
         
-        original_username = migrated_user['Username']
-        original_currency = migrated_user['Currency']
-        lvc_username = f"LVC_{original_username}{migrated_user['Postfix']}"
+        original_username = migrated_user.Username
+        original_currency = migrated_user.Currency
+        lvc_username = f"LVC_{migrated_user.FullUsername}"
 
         # Find the row to update by matching currency and original username
         for row in range(2, sheet.max_row + 1): # Start from row 2 to skip header
@@ -358,6 +641,42 @@ def update_excel_with_lvc_names(file_path, migrated_user):
         print(f"Error updating Excel file: {e}")
 
 
+# =============================================================================
+# Pre-flight Checks (Background File Parsing)
+# =============================================================================
+class PreflightSignals(QObject):
+    progress_update = pyqtSignal(str)
+    preflight_finished = pyqtSignal(str, str, list, list)
+    preflight_error = pyqtSignal(str)
+
+class PreflightRunnable(QRunnable):
+    """
+    Parses the credentials and user data files on a QThreadPool thread so the UI stays responsive.
+    """
+    def __init__(self, cred_path, user_data_path, mode):
+        super().__init__()
+        self.cred_path = cred_path
+        self.user_data_path = user_data_path
+        self.mode = mode
+        self.signals = PreflightSignals()
+
+    def run(self):
+        try:
+            self.signals.progress_update.emit(f"Parsing credentials file: {self.cred_path}")
+            email, password = parse_credentials_file(self.cred_path)
+            self.signals.progress_update.emit("  - Credentials parsed successfully.")
+
+            self.signals.progress_update.emit(f"Parsing user data file: {self.user_data_path}")
+            lvc_users, standard_users = parse_user_data(self.user_data_path, self.mode)
+            self.signals.progress_update.emit(f"  - Validation successful: Found {len(lvc_users)} LVC and {len(standard_users)} Standard users for mode '{self.mode}'.")
+        except Exception as e:
+            print("--- A FILE PARSING ERROR OCCURRED ---")
+            traceback.print_exc()
+            print("-------------------------------------")
+            self.signals.preflight_error.emit(f"Failed to read or validate an input file.\n\nError: {e}")
+            return
+        self.signals.preflight_finished.emit(email, password, lvc_users, standard_users)
+
 # =============================================================================
 # Automation Worker (Controller)
 # =============================================================================
@@ -366,7 +685,7 @@ class AutomationWorker(QObject):
     automation_error = pyqtSignal(str)
     automation_finished = pyqtSignal()
 
-    def __init__(self, gtp_url, email, password, lvc_users, standard_users, user_password, user_data_path, mode, lvc_balance, standard_balance):
+    def __init__(self, gtp_url, email, password, lvc_users, standard_users, user_password, user_data_path, mode, lvc_balance, standard_balance, reuse_session, element_timeout_ms, verbose):
         super().__init__()
         self.gtp_url = gtp_url
         self.email = email
@@ -378,67 +697,102 @@ class AutomationWorker(QObject):
         self.mode = mode
         self.lvc_balance = lvc_balance
         self.standard_balance = standard_balance
+        self.reuse_session = reuse_session
+        self.element_timeout_ms = element_timeout_ms
+        self.verbose = verbose
         self.is_running = True
         self.driver = None
 
     def run(self):
-        self.driver = BrowserDriver(progress_callback=self.progress_update.emit)
+        # One dedicated event loop per worker, bound to the automation thread.
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._run_async())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+    async def _create_users(self, users):
+        """
+        Creates the given users concurrently on up to MAX_PARALLEL pages.
+        Returns a list of success flags in the same order as the users.
+        """
+        results = [False] * len(users)
+        queue = asyncio.Queue()
+        for index, user in enumerate(users):
+            queue.put_nowait((index, user))
+
+        # Each page lives for the whole batch so it can stay on the form between users.
+        async def create_on_page():
+            page = await self.driver.open_create_user_page()
+            try:
+                while self.is_running and not queue.empty():
+                    index, user = queue.get_nowait()
+                    try:
+                        results[index] = await self.driver.create_user(self.gtp_url, page, user, self.user_password)
+                    except Exception as e:
+                        # A failure for one user (e.g. a navigation timeout) must not stop the other pages.
+                        self.progress_update.emit(f"  - [CRITICAL] Could not create user {user.FullUsername}. Error: {e}")
+            finally:
+                await self.driver.close_create_user_page(page)
+
+        tasks = [asyncio.create_task(create_on_page()) for _ in range(min(MAX_PARALLEL, len(users)))]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop the sibling pages and let them close their contexts before the driver shuts down.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return results
+
+    async def _run_async(self):
+        self.driver = BrowserDriver(progress_callback=self.progress_update.emit, reuse_session=self.reuse_session, element_timeout_ms=self.element_timeout_ms, verbose=self.verbose)
         try:
             self.progress_update.emit("Automation thread started.")
             if not self.is_running: return
 
-            self.driver.launch()
+            await self.driver.launch()
             if not self.is_running: return
             
-            self.driver.login(self.gtp_url, self.email, self.password)
+            await self.driver.login(self.gtp_url, self.email, self.password)
+            if not self.is_running: return
+
+            # --- User Creation (LVC and Standard users share one parallel batch) ---
+            lvc_users = self.lvc_users if self.mode in ["all", "lvc_only"] else []
+            standard_users = self.standard_users if self.mode in ["all", "standard_only"] else []
+            self.progress_update.emit(f"\n--- STEP A: Creating User Accounts ({MAX_PARALLEL} in parallel) ---")
+            results = await self._create_users(lvc_users + standard_users)
+            created_lvc_users = [user for user, success in zip(lvc_users, results[:len(lvc_users)]) if success]
+            created_standard_users = [user for user, success in zip(standard_users, results[len(lvc_users):]) if success]
             if not self.is_running: return
             
             # --- LVC User Processing ---
             if self.mode in ["all", "lvc_only"]:
-                self.progress_update.emit("\n--- STEP A: Creating LVC User Accounts ---")
-                created_lvc_users = []
-                if self.lvc_users:
-                    self.driver.navigate_to_create_user_page(self.gtp_url)
-                    for user in self.lvc_users:
-                        if not self.is_running: break
-                        success = self.driver.fill_user_creation_form(user, self.user_password)
-                        if success:
-                            created_lvc_users.append(user)
-                if not self.is_running: return
-
                 self.progress_update.emit("\n--- STEP B: Migrating Users to LVC ---")
                 for user in created_lvc_users:
                     if not self.is_running: break
-                    initial_username = f"{user['Username']}{user['Postfix']}"
-                    self.driver.migrate_user_to_lvc(self.gtp_url, initial_username)
+                    initial_username = user.FullUsername
+                    await self.driver.migrate_user_to_lvc(self.gtp_url, initial_username)
                     update_excel_with_lvc_names(self.user_data_path, user)
                 if not self.is_running: return
 
                 self.progress_update.emit("\n--- STEP C: Adding Balance to LVC Users ---")
                 for user in created_lvc_users:
                     if not self.is_running: break
-                    lvc_username = f"LVC_{user['Username']}{user['Postfix']}"
-                    self.driver.add_balance_to_user(self.gtp_url, lvc_username, self.lvc_balance)
+                    lvc_username = f"LVC_{user.FullUsername}"
+                    await self.driver.add_balance_to_user(self.gtp_url, lvc_username, self.lvc_balance)
                 if not self.is_running: return
 
             # --- Standard User Processing ---
             if self.mode in ["all", "standard_only"]:
-                self.progress_update.emit("\n--- Creating Standard User Accounts ---")
-                created_standard_users = []
-                if self.standard_users:
-                    self.driver.navigate_to_create_user_page(self.gtp_url)
-                    for user in self.standard_users:
-                        if not self.is_running: break
-                        success = self.driver.fill_user_creation_form(user, self.user_password)
-                        if success:
-                            created_standard_users.append(user)
-                if not self.is_running: return
-
                 self.progress_update.emit("\n--- Adding Balance to Standard Users ---")
                 for user in created_standard_users:
                     if not self.is_running: break
-                    standard_username = f"{user['Username']}{user['Postfix']}"
-                    self.driver.add_balance_to_user(self.gtp_url, standard_username, self.standard_balance)
+                    standard_username = user.FullUsername
+                    await self.driver.add_balance_to_user(self.gtp_url, standard_username, self.standard_balance)
 
             if self.is_running:
                 self.progress_update.emit("\nAutomation complete!")
@@ -459,7 +813,7 @@ class AutomationWorker(QObject):
             self.automation_error.emit(full_error_message)
         finally:
             if self.driver:
-                self.driver.close()
+                await self.driver.close()
             self.automation_finished.emit()
 
     def stop(self):
@@ -474,7 +828,11 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.automation_thread = None
         self.worker = None
+        self.preflight = None
+        self.run_settings = {}
+        self._log_buffer = []
         self.config = {}
+        self._last_config_bytes = None
         self.GTP_VERSIONS = {}
         self.setWindowTitle("GTP User Automation Tool v1.1")
         self.setGeometry(100, 100, 700, 650)
@@ -486,9 +844,23 @@ class MainWindow(QMainWindow):
         header_font = QFont()
         header_font.setPointSize(12)
         header_font.setBold(True)
+
+        # Coalesce bursts of config changes into a single write 100ms after the last one.
+        self.config_save_timer = QTimer(self)
+        self.config_save_timer.setSingleShot(True)
+        self.config_save_timer.setInterval(100)
+        self.config_save_timer.timeout.connect(self.write_config)
+
         self.load_config()
         self.setup_ui_elements(header_font)
         self.setup_connections()
+
+        # Coalesce log lines and append them to the status log at most every 100ms.
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setInterval(100)
+        self.log_flush_timer.timeout.connect(self.flush_log)
+        self.log_flush_timer.start()
+
         self.apply_config()
         self.check_start_button_state()
 
@@ -573,6 +945,24 @@ class MainWindow(QMainWindow):
         mode_layout.addWidget(self.radio_standard)
         mode_groupbox.setLayout(mode_layout)
         self.main_layout.addWidget(mode_groupbox)
+
+        self.reuse_session_checkbox = QCheckBox("Reuse saved session (skip login/MFA while it is valid)")
+        self.reuse_session_checkbox.setToolTip(f"Stores the session cookies in {STATE_FILE} in the working directory.")
+        self.main_layout.addWidget(self.reuse_session_checkbox)
+
+        self.debug_mode_checkbox = QCheckBox("Debug Mode (log every browser step)")
+        self.main_layout.addWidget(self.debug_mode_checkbox)
+
+        element_wait_layout = QHBoxLayout()
+        element_wait_label = QLabel("Element wait (s):")
+        self.element_wait_input = QSpinBox()
+        self.element_wait_input.setRange(1, 120)
+        self.element_wait_input.setValue(BrowserDriver.FAST_TIMEOUT_MS // 1000)
+        self.element_wait_input.setToolTip("Increase this for GTP pages that are known to be slow.")
+        element_wait_layout.addWidget(element_wait_label)
+        element_wait_layout.addWidget(self.element_wait_input)
+        element_wait_layout.addStretch(1)
+        self.main_layout.addLayout(element_wait_layout)
         
         self.start_button = QPushButton("Start Automation")
         self.start_button.setStyleSheet(
@@ -580,6 +970,9 @@ class MainWindow(QMainWindow):
             "QPushButton:hover { background-color: #45a049; }"
         )
         self.main_layout.addWidget(self.start_button)
+
+        self.shutdown_browser_button = QPushButton("Shutdown Browser")
+        self.main_layout.addWidget(self.shutdown_browser_button)
         
         log_header = QLabel("Status Log")
         log_header.setFont(header_font)
@@ -593,6 +986,8 @@ class MainWindow(QMainWindow):
         self.select_cred_button.clicked.connect(self.select_credentials_file)
         self.select_user_file_button.clicked.connect(self.select_user_data_file)
         self.start_button.clicked.connect(self.start_automation)
+        self.shutdown_browser_button.clicked.connect(self.shutdown_browser)
+        self.reuse_session_checkbox.toggled.connect(self.on_reuse_session_toggled)
 
     def start_automation(self):
         gtp_selection = self.gtp_dropdown.currentText()
@@ -602,6 +997,9 @@ class MainWindow(QMainWindow):
         user_password = self.user_password_input.text()
         lvc_balance = self.lvc_balance_input.text()
         standard_balance = self.standard_balance_input.text()
+        reuse_session = self.reuse_session_checkbox.isChecked()
+        element_timeout_ms = self.element_wait_input.value() * 1000
+        verbose = self.debug_mode_checkbox.isChecked()
         
         mode = "all"
         if self.radio_lvc.isChecked():
@@ -621,40 +1019,63 @@ class MainWindow(QMainWindow):
 
         self.log_message("="*50)
         self.log_message("Starting pre-flight checks...")
+        self.toggle_controls(False)
+        self.start_button.setText("Parsing…")
+
+        self.run_settings = {
+            'gtp_url': gtp_url, 'user_password': user_password, 'user_data_path': user_data_path, 'mode': mode,
+            'lvc_balance': lvc_balance, 'standard_balance': standard_balance,
+            'reuse_session': reuse_session, 'element_timeout_ms': element_timeout_ms, 'verbose': verbose,
+        }
+        self.preflight = PreflightRunnable(cred_path, user_data_path, mode)
+        self.preflight.signals.progress_update.connect(self.log_message, Qt.ConnectionType.QueuedConnection)
+        self.preflight.signals.preflight_finished.connect(self.on_preflight_finished, Qt.ConnectionType.QueuedConnection)
+        self.preflight.signals.preflight_error.connect(self.on_preflight_error, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(self.preflight)
+
+    def on_preflight_error(self, error_message):
+        self.preflight = None
+        self.log_message(f"[ERROR] {error_message}")
+        self.start_button.setText("Start Automation")
+        self.toggle_controls(True)
+        QMessageBox.critical(self, "File Error", error_message)
 
-        try:
-            self.log_message(f"Parsing credentials file: {cred_path}")
-            email, password = parse_credentials_file(cred_path)
-            self.log_message("  - Credentials parsed successfully.")
-            
-            self.log_message(f"Parsing user data file: {user_data_path}")
-            lvc_users, standard_users = parse_user_data(user_data_path, mode)
-            self.log_message(f"  - Validation successful: Found {len(lvc_users)} LVC and {len(standard_users)} Standard users for mode '{mode}'.")
-        except Exception as e:
-            print("--- A FILE PARSING ERROR OCCURRED ---")
-            traceback.print_exc()
-            print("-------------------------------------")
-            error_message = f"Failed to read or validate an input file.\n\nError: {e}"
-            self.log_message(f"[ERROR] {error_message}")
-            QMessageBox.critical(self, "File Error", error_message)
-            return
-
+    def on_preflight_finished(self, email, password, lvc_users, standard_users):
+        self.preflight = None
         self.log_message("Pre-flight checks passed. Starting automation process...")
-        self.toggle_controls(False)
+        self.start_button.setText("Start Automation")
 
         self.automation_thread = QThread()
-        self.worker = AutomationWorker(gtp_url, email, password, lvc_users, standard_users, user_password, user_data_path, mode, lvc_balance, standard_balance)
+        self.worker = AutomationWorker(email=email, password=password, lvc_users=lvc_users, standard_users=standard_users, **self.run_settings)
         self.worker.moveToThread(self.automation_thread)
 
-        self.worker.progress_update.connect(self.log_message)
-        self.worker.automation_error.connect(self.on_automation_error)
-        self.worker.automation_finished.connect(self.on_automation_finished)
+        # Worker signals are always emitted from the automation thread; queue them explicitly.
+        self.worker.progress_update.connect(self.log_message, Qt.ConnectionType.QueuedConnection)
+        self.worker.automation_error.connect(self.on_automation_error, Qt.ConnectionType.QueuedConnection)
+        self.worker.automation_finished.connect(self.on_automation_finished, Qt.ConnectionType.QueuedConnection)
 
         self.automation_thread.started.connect(self.worker.run)
         self.automation_thread.finished.connect(self.automation_thread.deleteLater)
         
         self.automation_thread.start()
 
+    def on_reuse_session_toggled(self, checked):
+        self.config['reuse_session'] = checked
+        self.save_config()
+        # Opting out also discards the stored session cookies.
+        if not checked and os.path.exists(STATE_FILE):
+            try:
+                os.remove(STATE_FILE)
+                self.log_message(f"Removed saved session ({STATE_FILE}).")
+            except OSError as e:
+                self.log_message(f"[ERROR] Could not remove {STATE_FILE}: {e}")
+
+    def shutdown_browser(self):
+        if BrowserDriver.shutdown_shared_browser():
+            self.log_message("Shared browser shut down.")
+        else:
+            self.log_message("No shared browser started by this session is running.")
+
     def on_automation_error(self, error_message):
         QMessageBox.critical(self, "Automation Error", error_message)
 
@@ -710,14 +1131,38 @@ class MainWindow(QMainWindow):
 
     def load_config(self):
         if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r') as f:
-                self.config = json.load(f)
+            try:
+                with open(CONFIG_FILE, 'r') as f:
+                    self.config = json.load(f)
+                # Treat the loaded contents as already written so an unchanged config isn't rewritten.
+                self._last_config_bytes = json.dumps(self.config, indent=4).encode()
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"Could not read {CONFIG_FILE}, starting with an empty configuration: {e}")
+                self.config = {}
         else:
             self.config = {}
+        if not isinstance(self.config, dict):
+            self.config = {}
 
     def save_config(self):
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(self.config, f, indent=4)
+        """Schedules a config write; see write_config."""
+        self.config_save_timer.start()
+
+    def write_config(self):
+        """Atomically writes the config file, skipping the write if nothing changed."""
+        self.config_save_timer.stop()
+        config_bytes = json.dumps(self.config, indent=4).encode()
+        if config_bytes == self._last_config_bytes:
+            return
+        temp_file = f"{CONFIG_FILE}.tmp"
+        try:
+            with open(temp_file, 'wb') as f:
+                f.write(config_bytes)
+            os.replace(temp_file, CONFIG_FILE)
+        except OSError as e:
+            print(f"Could not write {CONFIG_FILE}: {e}")
+            return
+        self._last_config_bytes = config_bytes
 
     def apply_config(self):
         """Applies loaded configuration to the UI."""
@@ -735,6 +1180,9 @@ class MainWindow(QMainWindow):
             self.user_file_path_label.setText(user_data_path)
             self.user_file_path_label.setStyleSheet("font-style: normal; color: #000;")
 
+        # Session persistence is opt-in; it stays off unless the user enabled it before.
+        self.reuse_session_checkbox.setChecked(bool(self.config.get('reuse_session', False)))
+
     def check_start_button_state(self):
         """Enables the start button only if all required files are selected."""
         gtp_loaded = bool(self.GTP_VERSIONS)
@@ -747,7 +1195,15 @@ class MainWindow(QMainWindow):
             self.start_button.setEnabled(False)
 
     def log_message(self, message):
-        self.status_log.append(message)
+        self._log_buffer.append(message)
+
+    def flush_log(self):
+        if not self._log_buffer:
+            return
+        if self.status_log.document().blockCount() > 5000:
+            self.status_log.clear() # Prevent unbounded memory growth over long runs
+        self.status_log.append("\n".join(self._log_buffer))
+        self._log_buffer.clear()
 
     def toggle_controls(self, enabled):
         self.gtp_dropdown.setEnabled(enabled)
@@ -758,16 +1214,22 @@ class MainWindow(QMainWindow):
         self.lvc_balance_input.setEnabled(enabled)
         self.standard_balance_input.setEnabled(enabled)
         self.start_button.setEnabled(enabled)
+        self.shutdown_browser_button.setEnabled(enabled)
         self.radio_all.setEnabled(enabled)
         self.radio_lvc.setEnabled(enabled)
         self.radio_standard.setEnabled(enabled)
+        self.reuse_session_checkbox.setEnabled(enabled)
+        self.element_wait_input.setEnabled(enabled)
+        self.debug_mode_checkbox.setEnabled(enabled)
         
     def closeEvent(self, event):
-        self.save_config() # Save config on close
+        self.write_config() # Flush any pending config changes on close
         if self.automation_thread and self.automation_thread.isRunning():
             self.worker.stop()
             self.automation_thread.quit()
             self.automation_thread.wait()
+        # Don't leave a browser with remote debugging open once no session can shut it down.
+        BrowserDriver.shutdown_shared_browser()
         event.accept()
 
 def main():